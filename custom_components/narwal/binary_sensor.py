@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
+    BinarySensorEntityDescription,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
@@ -12,9 +16,35 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from . import NarwalConfigEntry
 from .coordinator import NarwalCoordinator
 from .entity import NarwalEntity
+from .narwal_client import NarwalState
 from .narwal_client.const import WorkingStatus
 
 
+@dataclass(frozen=True, kw_only=True)
+class NarwalBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes a Narwal binary sensor entity."""
+
+    value_fn: Callable[[NarwalState], bool | None]
+
+
+BINARY_SENSOR_DESCRIPTIONS: tuple[NarwalBinarySensorEntityDescription, ...] = (
+    NarwalBinarySensorEntityDescription(
+        key="docked",
+        translation_key="docked",
+        value_fn=lambda state: state.is_docked,
+    ),
+    NarwalBinarySensorEntityDescription(
+        key="charging",
+        translation_key="charging",
+        device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
+        # Charging (DOCKED=10) vs charged (CHARGED=14); unknown off the dock
+        value_fn=lambda state: state.working_status == WorkingStatus.DOCKED
+        if state.is_docked
+        else None,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: NarwalConfigEntry,
@@ -22,53 +52,31 @@ async def async_setup_entry(
 ) -> None:
     """Set up Narwal binary sensor entities."""
     coordinator = entry.runtime_data
-    async_add_entities([
-        NarwalDockedSensor(coordinator),
-        NarwalChargingSensor(coordinator),
-    ])
+    async_add_entities(
+        NarwalBinarySensor(coordinator, description)
+        for description in BINARY_SENSOR_DESCRIPTIONS
+    )
 
 
-class NarwalDockedSensor(NarwalEntity, BinarySensorEntity):
-    """Binary sensor that reports whether the vacuum is on the dock."""
+class NarwalBinarySensor(NarwalEntity, BinarySensorEntity):
+    """A Narwal binary sensor entity."""
 
-    _attr_translation_key = "docked"
+    entity_description: NarwalBinarySensorEntityDescription
 
-    def __init__(self, coordinator: NarwalCoordinator) -> None:
-        """Initialize the docked sensor."""
+    def __init__(
+        self,
+        coordinator: NarwalCoordinator,
+        description: NarwalBinarySensorEntityDescription,
+    ) -> None:
+        """Initialize the binary sensor."""
         super().__init__(coordinator)
-        device_id = coordinator.config_entry.data["device_id"]
-        self._attr_unique_id = f"{device_id}_docked"
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.device_id}_{description.key}"
 
     @property
     def is_on(self) -> bool | None:
-        """Return True if the vacuum is on the dock."""
+        """Return the binary sensor state."""
         state = self.coordinator.data
         if state is None:
             return None
-        return state.is_docked
-
-
-class NarwalChargingSensor(NarwalEntity, BinarySensorEntity):
-    """Binary sensor: Charging / Not charging, only when docked."""
-
-    _attr_translation_key = "charging"
-    _attr_device_class = BinarySensorDeviceClass.BATTERY_CHARGING
-
-    def __init__(self, coordinator: NarwalCoordinator) -> None:
-        """Initialize the charging sensor."""
-        super().__init__(coordinator)
-        device_id = coordinator.config_entry.data["device_id"]
-        self._attr_unique_id = f"{device_id}_charging"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if charging (DOCKED=10), False if charged (CHARGED=14).
-
-        Returns None (unavailable) when not docked.
-        """
-        state = self.coordinator.data
-        if state is None:
-            return None
-        if not state.is_docked:
-            return None
-        return state.working_status == WorkingStatus.DOCKED
+        return self.entity_description.value_fn(state)
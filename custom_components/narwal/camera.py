@@ -12,6 +12,7 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from . import NarwalConfigEntry
 from .coordinator import NarwalCoordinator
 from .entity import NarwalEntity
+from .narwal_client import MapData
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,12 +42,15 @@ class NarwalMapCamera(NarwalEntity, Camera):
         """Initialize the map camera entity."""
         super().__init__(coordinator)
         Camera.__init__(self)
-        device_id = coordinator.config_entry.data["device_id"]
-        self._attr_unique_id = f"{device_id}_map"
+        self._attr_unique_id = f"{coordinator.device_id}_map"
         self._cached_image: bytes | None = None
-        # Cache key: (static_map_ts, display_map_ts) — re-render when either changes
-        self._cache_key: tuple[int, int] = (0, 0)
+        # Cache key: (static_map_ts, map_hash, robot pose) — re-render when any changes
+        self._cache_key: tuple[int, int, tuple[float, float, float] | None] | None = None
         self._last_render_time: float = 0.0
+        self._failed_key: tuple[int, int, tuple[float, float, float] | None] | None = None
+        # Room names only change with a new static map — rebuilt per MapData
+        self._room_names: dict[int, str] | None = None
+        self._room_names_source: MapData | None = None
 
     async def async_camera_image(
         self, width: int | None = None, height: int | None = None,
@@ -66,23 +70,33 @@ class NarwalMapCamera(NarwalEntity, Camera):
         if static_map.width <= 0 or static_map.height <= 0:
             return self._cached_image
 
-        # Build cache key from both data sources
+        # Build cache key from the render inputs, not the display timestamp —
+        # display_map re-broadcasts with a new timestamp even when the robot
+        # hasn't moved. hash() of a bytes object is cached by CPython, so
+        # hashing the unchanged compressed map is O(1) after the first frame.
         static_ts = static_map.created_at or 0
         display_ts = display.timestamp if display else 0
-        new_key = (static_ts, display_ts)
-
-        now = time.monotonic()
-        since_render = now - self._last_render_time if self._last_render_time else 999
-
-        # Skip re-render if nothing changed
+        pose = (
+            (display.robot_x, display.robot_y, display.robot_heading)
+            if display
+            else None
+        )
+        new_key = (static_ts, hash(static_map.compressed_map), pose)
+
+        # Skip re-render if nothing changed, or if these exact inputs already
+        # failed to render (retrying would fail the same way)
         if new_key == self._cache_key and self._cached_image:
             return self._cached_image
+        if new_key == self._failed_key:
+            return self._cached_image
 
-        # Throttle renders during cleaning (display_map arrives every ~1.5s)
+        # Throttle renders during cleaning (display_map arrives every ~1.5s).
+        # The clock is only read once a render is actually on the table.
+        now = time.monotonic()
         if (
             display_ts > 0
             and self._cached_image
-            and since_render < _MIN_RENDER_INTERVAL
+            and now - self._last_render_time < _MIN_RENDER_INTERVAL
         ):
             return self._cached_image
 
@@ -90,35 +104,39 @@ class NarwalMapCamera(NarwalEntity, Camera):
         robot_x = None
         robot_y = None
         robot_heading = None
+        # Only reached on a cache miss — conversion and logging are per render
         if display:
-            _LOGGER.debug(
-                "MAP: raw=(%.2f, %.2f) heading=%.1f origin=(%d,%d) res=%d",
-                display.robot_x, display.robot_y, display.robot_heading,
-                static_map.origin_x, static_map.origin_y,
-                static_map.resolution,
-            )
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
+            if debug:
+                _LOGGER.debug(
+                    "MAP: raw=(%.2f, %.2f) heading=%.1f origin=(%d,%d) res=%d",
+                    display.robot_x, display.robot_y, display.robot_heading,
+                    static_map.origin_x, static_map.origin_y,
+                    static_map.resolution,
+                )
             grid_pos = display.to_grid_coords(
                 static_map.resolution, static_map.origin_x, static_map.origin_y,
             )
             if grid_pos is not None:
                 robot_x, robot_y = grid_pos
                 robot_heading = display.robot_heading
-                _LOGGER.debug(
-                    "MAP: robot=(%d, %d) heading=%.1f dock=(%s, %s) map=%dx%d",
-                    int(robot_x), int(robot_y), robot_heading,
-                    int(static_map.dock_x) if static_map.dock_x is not None else "?",
-                    int(static_map.dock_y) if static_map.dock_y is not None else "?",
-                    static_map.width, static_map.height,
-                )
+                if debug:
+                    _LOGGER.debug(
+                        "MAP: robot=(%d, %d) heading=%.1f dock=(%s, %s) map=%dx%d",
+                        robot_x, robot_y, robot_heading,
+                        static_map.dock_x, static_map.dock_y,
+                        static_map.width, static_map.height,
+                    )
 
         # Dock position and room names from static map
         dock_x = static_map.dock_x
         dock_y = static_map.dock_y
-        room_names: dict[int, str] | None = None
-        if static_map.rooms:
-            room_names = {
+        if static_map is not self._room_names_source:
+            self._room_names = {
                 r.room_id: r.name for r in static_map.rooms if r.name
-            }
+            } if static_map.rooms else None
+            self._room_names_source = static_map
+        room_names = self._room_names
 
         # Render in executor (Pillow is CPU-bound)
         try:
@@ -142,7 +160,12 @@ class NarwalMapCamera(NarwalEntity, Camera):
                 self._cache_key = new_key
                 self._last_render_time = now
 
+        except (OSError, ValueError) as err:
+            # Pillow raises these for corrupt or oversized map data
+            self._failed_key = new_key
+            _LOGGER.warning("Failed to render map image: %s", err)
         except Exception:
-            _LOGGER.exception("Failed to render map image")
+            self._failed_key = new_key
+            _LOGGER.exception("Unexpected error rendering map image")
 
         return self._cached_image
@@ -23,6 +23,14 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
+async def _async_safe_disconnect(client: NarwalClient) -> None:
+    """Disconnect a probe client, logging rather than raising on failure."""
+    try:
+        await client.disconnect()
+    except Exception:
+        _LOGGER.debug("Error closing config flow connection", exc_info=True)
+
+
 class NarwalConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Narwal vacuum."""
 
@@ -44,8 +52,11 @@ class NarwalConfigFlow(ConfigFlow, domain=DOMAIN):
                 # Discover device_id from broadcast, then query info
                 await client.discover_device_id(timeout=15.0)
                 device_info = await client.get_device_info()
-            except (NarwalConnectionError, NarwalCommandError, Exception):
+            except (NarwalConnectionError, NarwalCommandError):
                 errors["base"] = "cannot_connect"
+            except Exception:
+                _LOGGER.exception("Unexpected error validating Narwal connection")
+                errors["base"] = "unknown"
             else:
                 device_id = device_info.device_id
                 await self.async_set_unique_id(device_id)
@@ -64,7 +75,13 @@ class NarwalConfigFlow(ConfigFlow, domain=DOMAIN):
                     },
                 )
             finally:
-                await client.disconnect()
+                # Close the probe connection in the background so the form
+                # result is not held up by the socket close handshake
+                self.hass.async_create_background_task(
+                    _async_safe_disconnect(client),
+                    f"{DOMAIN}_config_flow_disconnect",
+                    eager_start=True,
+                )
 
         return self.async_show_form(
             step_id="user",
@@ -1,5 +1,8 @@
 """Constants for the Narwal vacuum integration."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from homeassistant.const import Platform
 
 from .narwal_client import FanLevel
@@ -17,11 +20,12 @@ PLATFORMS: list[Platform] = [
     Platform.CAMERA,
 ]
 
-FAN_SPEED_MAP: dict[str, FanLevel] = {
+# Read-only lookup tables — shared by every entity, never copied
+FAN_SPEED_MAP: Mapping[str, FanLevel] = MappingProxyType({
     "quiet": FanLevel.QUIET,
     "normal": FanLevel.NORMAL,
     "strong": FanLevel.STRONG,
     "max": FanLevel.MAX,
-}
+})
 
-FAN_SPEED_LIST: list[str] = list(FAN_SPEED_MAP.keys())
+FAN_SPEED_LIST: tuple[str, ...] = tuple(FAN_SPEED_MAP)
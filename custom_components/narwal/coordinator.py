@@ -3,14 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import random
+import time
+from dataclasses import replace
 from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .narwal_client import NarwalClient, NarwalConnectionError, NarwalState
+from .narwal_client import (
+    NarwalClient,
+    NarwalCommandError,
+    NarwalConnectionError,
+    NarwalState,
+)
 from .narwal_client.const import WorkingStatus
 
 from .const import DOMAIN
@@ -18,21 +28,72 @@ from .const import DOMAIN
 _LOGGER = logging.getLogger(__name__)
 
 POLL_INTERVAL = timedelta(seconds=60)
-
-# Fast re-poll when state is incomplete (robot asleep at startup)
-FAST_POLL_INTERVAL = timedelta(seconds=10)
-FAST_POLL_MAX = 6  # up to 60s of fast polling before falling back to normal
+# State barely changes on the dock; a docked robot that starts moving
+# broadcasts anyway, so the fallback poll can back off
+DOCKED_POLL_INTERVAL = timedelta(minutes=5)
+
+# Fast re-poll when state is incomplete (robot asleep at startup), as the
+# waits before each poll. A robot that answers at all usually does so within
+# seconds of the wake burst, so polls are packed early and spread out later —
+# same 6 polls over 60s of waiting as a flat 10s interval, but a quick waker
+# is caught sooner. Each poll adds its own round trip (up to the 5s command
+# timeout on a silent robot); the wake runs in the background and adds none.
+FAST_POLL_SCHEDULE: tuple[timedelta, ...] = tuple(
+    timedelta(seconds=seconds) for seconds in (3, 5, 7, 10, 15, 20)
+)
+
+# Follow-up polls after a user command, as gaps between polls (1s, 2s, 5s,
+# 10s): the state change usually lands within seconds, so check early and
+# then back off. Stops as soon as a broadcast arrives.
+COMMAND_POLL_SCHEDULE: tuple[timedelta, ...] = tuple(
+    timedelta(seconds=seconds) for seconds in (1, 2, 5, 10)
+)
+
+# Upper bound on the startup device info + status fetch, i.e. the two
+# commands' own 5s timeouts back to back (seconds)
+STARTUP_FETCH_TIMEOUT = 10.0
+
+# Broadcasts arrive every ~1.5s while awake — coalesce them into at most one
+# listener update per cooldown window (mode transitions bypass the window)
+PUSH_COOLDOWN = 1.5
+
+# Back off exponentially (with jitter) while the robot stays unreachable
+MAX_BACKOFF = timedelta(minutes=10)
+
+# Skip the fallback get_status() while broadcasts are this fresh (seconds)
+PUSH_FRESHNESS = 30.0
+
+# Everything a client command is expected to raise. Anything else is a bug
+# and is left to propagate to the coordinator's own error logging.
+_CLIENT_ERRORS = (NarwalConnectionError, NarwalCommandError)
+
+
+def _is_transition(old: NarwalState, new: NarwalState) -> bool:
+    """Return True if the state change must reach entities without delay."""
+    return (
+        old.working_status != new.working_status
+        or old.is_docked != new.is_docked
+        or old.is_returning != new.is_returning
+        or old.is_paused != new.is_paused
+    )
 
 
 class NarwalCoordinator(DataUpdateCoordinator[NarwalState]):
     """Push-mode coordinator for Narwal vacuum.
 
     Primary data source is WebSocket broadcasts (every ~1.5s when awake).
-    Fallback polling every 60s via get_status() in case broadcasts stop.
+    Fallback polling every 60s (5 min while docked) via get_status() in case
+    broadcasts stop; the poll is skipped while the robot is awake and
+    broadcasting.
 
     The robot's command responses and broadcasts both include dock indicator
     fields (11, 47, 3.10, 3.12) — even during deep sleep. The state model
     parses these correctly; no inference or heuristics needed.
+
+    The client mutates a single NarwalState in place, so the coordinator
+    always publishes a shallow copy. With always_update=False this lets
+    unchanged snapshots (e.g. repeated broadcasts at rest) skip the listener
+    fan-out entirely.
     """
 
     config_entry: ConfigEntry
@@ -44,59 +105,99 @@ class NarwalCoordinator(DataUpdateCoordinator[NarwalState]):
             _LOGGER,
             name=DOMAIN,
             update_interval=POLL_INTERVAL,
+            always_update=False,
         )
+        data = entry.data
+        self.device_id: str = data.get("device_id", "")
         self.client = NarwalClient(
-            host=entry.data["host"],
-            port=entry.data["port"],
-            device_id=entry.data.get("device_id", ""),
+            host=data["host"],
+            port=data["port"],
+            device_id=self.device_id,
         )
         self._listen_task: asyncio.Task[None] | None = None
-        self._fast_poll_remaining = 0
+        self._wake_task: asyncio.Task[None] | None = None
+        self._fast_poll_task: asyncio.Task[None] | None = None
+        self._command_poll_task: asyncio.Task[None] | None = None
+        self._error_count = 0  # consecutive failed polls
+        self._last_push = 0.0  # monotonic time of the last broadcast
+        # Set by the first broadcast carrying a known working status
+        self._status_known = asyncio.Event()
+        self._push_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=PUSH_COOLDOWN,
+            immediate=True,
+            function=self._async_publish_push,
+        )
 
     async def async_setup(self) -> None:
         """Connect to the vacuum and start the WebSocket listener.
 
         Keeps setup fast (<15s) so HA doesn't time out. If the robot is
         asleep, entities are created with defaults and a fast re-poll
-        (every 10s) populates them once the robot wakes.
+        (packed into the first minute) populates them once the robot wakes.
         """
         await self.client.connect()
 
         # Set up push callback before starting listener
         self.client.on_state_update = self._on_state_update
 
-        # Start persistent WebSocket listener as a background task.
+        # Start persistent WebSocket listener as a background task. Eager
+        # start runs it up to its first recv() right away, so responses to
+        # the setup commands below are already being consumed.
         self._listen_task = self.config_entry.async_create_background_task(
             self.hass,
             self.client.start_listening(),
             f"{DOMAIN}_ws_listener",
+            eager_start=True,
         )
 
-        # Quick wake attempt (5s, not 20s — keep setup fast)
-        await self.client.wake(timeout=5.0)
-
-        # Single attempt at fetching initial state
+        # Quick wake attempt (5s, not 20s — keep setup fast). It must finish
+        # before the fetches: field5 responses carry no request id, so a
+        # response to a wake burst frame could otherwise answer one of them.
         try:
-            await self.client.get_device_info()
-        except Exception:
-            _LOGGER.debug("Could not fetch device info")
-
+            await self.client.wake(timeout=5.0)
+        except _CLIENT_ERRORS as err:
+            _LOGGER.debug("Startup wake failed: %s", err)
+
+        # Single attempt at fetching initial state. The client runs commands
+        # in FIFO order, so device info (which sets the topic prefix) still
+        # goes first. The phase is bounded so one hung RPC can't stall HA
+        # startup.
         try:
-            await self.client.get_status(full_update=True)
-        except Exception:
-            _LOGGER.debug("Could not fetch initial status")
-
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    self.client.get_device_info(),
+                    self.client.get_status(full_update=True),
+                    return_exceptions=True,
+                ),
+                timeout=STARTUP_FETCH_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            _LOGGER.warning(
+                "Startup fetch exceeded %.0fs — continuing with partial state",
+                STARTUP_FETCH_TIMEOUT,
+            )
+        else:
+            for what, result in zip(
+                ("device info", "initial status"), results, strict=True
+            ):
+                if isinstance(result, Exception):
+                    _LOGGER.debug("Startup %s failed: %s", what, result)
+
+        # The map is only fetched here, so it gets its own (longer) command
+        # timeout rather than being cut short by the bound above
         try:
             await self.client.get_map()
-        except Exception:
-            _LOGGER.debug("Could not fetch initial map")
+        except Exception as err:  # a malformed map must not fail setup
+            _LOGGER.debug("Startup initial map failed: %s", err)
 
         # Brief wait for broadcasts if status is still unknown
         if self.client.state.working_status == WorkingStatus.UNKNOWN:
-            for _ in range(6):  # up to 3 seconds
-                await asyncio.sleep(0.5)
-                if self.client.state.working_status != WorkingStatus.UNKNOWN:
-                    break
+            try:
+                await asyncio.wait_for(self._status_known.wait(), timeout=3.0)
+            except asyncio.TimeoutError:
+                pass
 
         state = self.client.state
 
@@ -109,36 +210,51 @@ class NarwalCoordinator(DataUpdateCoordinator[NarwalState]):
             self.client.robot_awake,
         )
 
-        self.async_set_updated_data(state)
+        self.async_set_updated_data(replace(state))
 
         # If robot didn't respond, use fast polling to catch it when it wakes
         if state.working_status == WorkingStatus.UNKNOWN:
-            self._fast_poll_remaining = FAST_POLL_MAX
-            self.update_interval = FAST_POLL_INTERVAL
+            self._fast_poll_task = self.config_entry.async_create_background_task(
+                self.hass, self._async_fast_poll(), f"{DOMAIN}_fast_poll"
+            )
             _LOGGER.info(
-                "Robot asleep — fast polling every %ds until it responds",
-                int(FAST_POLL_INTERVAL.total_seconds()),
+                "Robot asleep — fast polling %d times over %ds of waiting "
+                "until it responds",
+                len(FAST_POLL_SCHEDULE),
+                sum(step.total_seconds() for step in FAST_POLL_SCHEDULE),
             )
 
     def _on_state_update(self, state: NarwalState) -> None:
         """Handle a push state update from the WebSocket listener."""
-        _LOGGER.debug(
-            "Broadcast update: status=%s, docked=%s, f11=%d, f47=%d, "
-            "dock_sub=%d, dock_act=%d",
-            state.working_status.name, state.is_docked,
-            state.dock_field11, state.dock_field47,
-            state.dock_sub_state, state.dock_activity,
-        )
-        self.async_set_updated_data(state)
-
-        # Broadcast arrived — switch back to normal polling if in fast mode
-        if self._fast_poll_remaining > 0:
-            self._fast_poll_remaining = 0
-            self.update_interval = POLL_INTERVAL
-            _LOGGER.info(
-                "Narwal broadcast received: status=%s — normal polling restored",
-                state.working_status.name,
+        # Runs for every broadcast — skip building the log args when unused
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Broadcast update: status=%s, docked=%s, f11=%d, f47=%d, "
+                "dock_sub=%d, dock_act=%d",
+                state.working_status.name, state.is_docked,
+                state.dock_field11, state.dock_field47,
+                state.dock_sub_state, state.dock_activity,
             )
+        self._last_push = time.monotonic()
+        if state.working_status != WorkingStatus.UNKNOWN:
+            self._status_known.set()
+
+        if self.data is None or _is_transition(self.data, state):
+            # Mode change — publish now and drop any pending trailing update
+            self._push_debouncer.async_cancel()
+            self._async_publish_push()
+        else:
+            self._push_debouncer.async_schedule_call()
+
+        # Broadcast arrived — the robot is reachable again
+        self._restore_poll_interval(state)
+
+    @callback
+    def _async_publish_push(self) -> None:
+        """Publish the client's latest state if it differs from the last snapshot."""
+        snapshot = replace(self.client.state)
+        if snapshot != self.data:
+            self.async_set_updated_data(snapshot)
 
     async def _async_update_data(self) -> NarwalState:
         """Polling fallback — fetch status if no push updates arrived."""
@@ -146,49 +262,183 @@ class NarwalCoordinator(DataUpdateCoordinator[NarwalState]):
             try:
                 await self.client.connect()
             except NarwalConnectionError as err:
+                self._backoff()
                 raise UpdateFailed(f"Cannot connect to vacuum: {err}") from err
 
+        # Broadcasts are authoritative while they keep coming — no need to
+        # spend a round-trip re-reading the same state
+        if (
+            self.client.robot_awake
+            and self.data is not None
+            and time.monotonic() - self._last_push < PUSH_FRESHNESS
+        ):
+            return replace(self.client.state)
+
         # Try to wake the robot if not broadcasting
-        if not self.client.robot_awake:
-            await self.client.wake(timeout=20.0)
+        self._ensure_wake()
 
-        # Query full status — response includes dock fields even in deep sleep
         try:
+            # Query full status — response includes dock fields even in deep sleep
             await self.client.get_status(full_update=True)
-        except Exception as err:
+        except _CLIENT_ERRORS as err:
+            self._backoff()
             raise UpdateFailed(f"Failed to get status: {err}") from err
 
-        state = self.client.state
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            state = self.client.state
+            _LOGGER.debug(
+                "Poll update: status=%s, docked=%s, battery=%d, "
+                "f11=%d, f47=%d, awake=%s",
+                state.working_status.name, state.is_docked,
+                state.battery_level,
+                state.dock_field11, state.dock_field47,
+                self.client.robot_awake,
+            )
 
-        _LOGGER.debug(
-            "Poll update: status=%s, docked=%s, battery=%d, "
-            "f11=%d, f47=%d, awake=%s",
-            state.working_status.name, state.is_docked,
-            state.battery_level,
-            state.dock_field11, state.dock_field47,
-            self.client.robot_awake,
-        )
+        self._restore_poll_interval(self.client.state)
+        return replace(self.client.state)
+
+    def _restore_poll_interval(self, state: NarwalState) -> None:
+        """End any error backoff and poll at the rate for the robot's mode.
+
+        The single place the steady-state interval is set; called whenever
+        the robot has just proven reachable (broadcast or successful poll).
+        """
+        if self._error_count:
+            _LOGGER.debug(
+                "Robot reachable after %d failed poll(s)", self._error_count
+            )
+            self._error_count = 0
+        interval = DOCKED_POLL_INTERVAL if state.is_docked else POLL_INTERVAL
+        if self.update_interval != interval:
+            self.update_interval = interval
+
+    async def _async_fast_poll(self) -> None:
+        """Re-poll a robot that was asleep at startup until it reports a status.
+
+        Each step waits for a broadcast with a known status (which ends fast
+        polling at once) and falls back to get_status() when none arrives.
+        Runs beside the regular poll rather than retuning update_interval.
+        """
+        for step in FAST_POLL_SCHEDULE:
+            try:
+                await asyncio.wait_for(
+                    self._status_known.wait(), timeout=step.total_seconds()
+                )
+            except asyncio.TimeoutError:
+                pass
+            else:
+                _LOGGER.info(
+                    "Narwal broadcast received: status=%s — fast polling stopped",
+                    self.client.state.working_status.name,
+                )
+                return
+
+            self._ensure_wake()
+            try:
+                await self.client.get_status(full_update=True)
+            except _CLIENT_ERRORS as err:
+                _LOGGER.debug("Fast poll failed: %s", err)
+                continue
 
-        # Manage fast poll countdown
-        if self._fast_poll_remaining > 0:
+            self._async_publish_push()
             if self.client.state.working_status != WorkingStatus.UNKNOWN:
-                self._fast_poll_remaining = 0
-                self.update_interval = POLL_INTERVAL
                 _LOGGER.info(
-                    "Narwal poll got status=%s — normal polling restored",
+                    "Narwal poll got status=%s — fast polling stopped",
                     self.client.state.working_status.name,
                 )
-            else:
-                self._fast_poll_remaining -= 1
-                if self._fast_poll_remaining <= 0:
-                    self.update_interval = POLL_INTERVAL
-                    _LOGGER.info("Fast poll exhausted — normal polling restored")
+                return
+
+        _LOGGER.info("Fast poll exhausted — normal polling continues")
+
+    @callback
+    def async_trigger_fast_poll(self) -> None:
+        """Poll on a short schedule after a user command.
+
+        Catches the resulting state change quickly even if broadcasts have
+        stalled. A newer command restarts the schedule.
+        """
+        if self._command_poll_task and not self._command_poll_task.done():
+            self._command_poll_task.cancel()
+        self._command_poll_task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_command_poll(time.monotonic()),
+            f"{DOMAIN}_command_poll",
+        )
 
-        return self.client.state
+    async def _async_command_poll(self, issued: float) -> None:
+        """Re-query status until a broadcast newer than the command arrives."""
+        for step in COMMAND_POLL_SCHEDULE:
+            await asyncio.sleep(step.total_seconds())
+            if self._last_push > issued:
+                return  # broadcasts are flowing — they carry the change
+            try:
+                await self.client.get_status(full_update=True)
+            except _CLIENT_ERRORS as err:
+                _LOGGER.debug("Command follow-up poll failed: %s", err)
+                continue
+            self._async_publish_push()
+
+    def _ensure_wake(self) -> None:
+        """Start a background wake unless the robot is awake or one is running.
+
+        The wake can take up to 20s; broadcasts push the fresh state through
+        _on_state_update once it succeeds.
+        """
+        # An eager task that fails before its first await finishes (and
+        # clears the handle) before it is stored — treat it as absent
+        if not self.client.robot_awake and (
+            self._wake_task is None or self._wake_task.done()
+        ):
+            self._wake_task = self.config_entry.async_create_background_task(
+                self.hass, self._async_wake(), f"{DOMAIN}_wake"
+            )
+
+    async def _async_wake(self) -> None:
+        """Wake the robot, allowing the next poll to try again when done."""
+        try:
+            await self.client.wake(timeout=20.0)
+        except NarwalConnectionError as err:
+            _LOGGER.debug("Wake failed: %s", err)
+        finally:
+            self._wake_task = None
+
+    def _backoff(self) -> None:
+        """Stretch the poll interval after a failed poll.
+
+        The delay doubles per consecutive failure (capped at MAX_BACKOFF) and
+        is jittered so several installs don't retry in lockstep. It never
+        drops below the steady interval for the robot's last known mode.
+        """
+        self._error_count += 1
+        steady = (
+            DOCKED_POLL_INTERVAL
+            if self.data is not None and self.data.is_docked
+            else POLL_INTERVAL
+        )
+        base = steady.total_seconds()
+        ceiling = min(
+            MAX_BACKOFF.total_seconds(), base * 2 ** min(self._error_count, 6)
+        )
+        self.update_interval = timedelta(seconds=random.uniform(base, ceiling))
+        _LOGGER.debug(
+            "Poll failed %d time(s) in a row — next attempt in %.0fs",
+            self._error_count, self.update_interval.total_seconds(),
+        )
 
     async def async_shutdown(self) -> None:
-        """Disconnect from the vacuum."""
-        await self.client.disconnect()
+        """Stop the listener and disconnect from the vacuum."""
+        self._push_debouncer.async_shutdown()
+        for task in (
+            self._wake_task, self._fast_poll_task, self._command_poll_task
+        ):
+            if task and not task.done():
+                task.cancel()
+        # Stop the listener first so it sees a clean cancel rather than the
+        # socket closing underneath it, and let it finish its cleanup
         if self._listen_task and not self._listen_task.done():
             self._listen_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, asyncio.TimeoutError):
+                await asyncio.wait_for(self._listen_task, timeout=2.0)
+        await self.client.disconnect()
         await super().async_shutdown()
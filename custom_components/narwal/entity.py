@@ -17,9 +17,8 @@ class NarwalEntity(CoordinatorEntity[NarwalCoordinator]):
     def __init__(self, coordinator: NarwalCoordinator) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
-        device_id = coordinator.config_entry.data["device_id"]
         self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
+            identifiers={(DOMAIN, coordinator.device_id)},
             manufacturer=MANUFACTURER,
             model=MODEL,
             sw_version=coordinator.client.state.firmware_version or None,
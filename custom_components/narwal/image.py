@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 import logging
 import time
@@ -13,6 +14,7 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from . import NarwalConfigEntry
 from .coordinator import NarwalCoordinator
 from .entity import NarwalEntity
+from .narwal_client import MapData, NarwalState
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,31 +43,45 @@ class NarwalMapImage(NarwalEntity, ImageEntity):
         """Initialize the map image entity."""
         super().__init__(coordinator)
         ImageEntity.__init__(self, hass)
-        device_id = coordinator.config_entry.data["device_id"]
-        self._attr_unique_id = f"{device_id}_map"
+        self._attr_unique_id = f"{coordinator.device_id}_map"
         self._cached_image: bytes | None = None
-        # Cache key: (static_map_ts, display_map_ts) — re-render when either changes
-        self._cache_key: tuple[int, int] = (0, 0)
+        # Cache key: (static_map_ts, map_hash, robot pose) — re-render when any changes
+        self._cache_key: tuple[int, int, tuple[float, float, float] | None] | None = None
         self._last_render_time: float = 0.0
+        # (epoch seconds, datetime) most recently reported by image_last_updated
+        self._last_updated: tuple[float, datetime] | None = None
+        # Coordinator snapshot the cached image is known to reflect
+        self._rendered_data: NarwalState | None = None
+        # At most one render runs at a time; concurrent callers share it
+        self._render_task: asyncio.Task[None] | None = None
+        # Room names and grid parameters only change with a new static map —
+        # rebuilt per MapData
+        self._room_names: dict[int, str] | None = None
+        self._grid_params: tuple[int, int, int] = (0, 0, 0)
+        self._static_source: MapData | None = None
 
     @property
     def image_last_updated(self) -> datetime | None:
         """Return when the image was last updated."""
         state = self.coordinator.client.state
+        display = state.map_display_data
+        static_map = state.map_data
 
         # Prefer real-time display_map timestamp (ms since epoch)
-        if state.map_display_data and state.map_display_data.timestamp:
-            return datetime.fromtimestamp(
-                state.map_display_data.timestamp / 1000, tz=timezone.utc
-            )
-
+        if display and display.timestamp:
+            seconds = display.timestamp / 1000
         # Fall back to static map created_at
-        if state.map_data and state.map_data.created_at:
-            return datetime.fromtimestamp(
-                state.map_data.created_at, tz=timezone.utc
+        elif static_map and static_map.created_at:
+            seconds = static_map.created_at
+        else:
+            return None
+
+        # Polled far more often than the timestamp changes
+        if self._last_updated is None or self._last_updated[0] != seconds:
+            self._last_updated = (
+                seconds, datetime.fromtimestamp(seconds, tz=timezone.utc)
             )
-
-        return None
+        return self._last_updated[1]
 
     async def async_image(self) -> bytes | None:
         """Return the map as a PNG image.
@@ -73,26 +89,52 @@ class NarwalMapImage(NarwalEntity, ImageEntity):
         Always uses the static map grid as background, with robot position
         overlaid from display_map when the robot is actively cleaning.
         """
+        # Nothing has been published since the image was last rendered or
+        # validated — skip the cache-key work entirely
+        data = self.coordinator.data
+        if data is not None and data is self._rendered_data and self._cached_image:
+            return self._cached_image
+
         state = self.coordinator.client.state
         static_map = state.map_data
         display = state.map_display_data
 
         # Must have a static map to render anything
-        if not static_map or not static_map.compressed_map:
+        if not static_map:
             return self._cached_image
-        if static_map.width <= 0 or static_map.height <= 0:
+        # Each static-map field is read once and passed on from locals
+        compressed = static_map.compressed_map
+        width = static_map.width
+        height = static_map.height
+        if not compressed or width <= 0 or height <= 0:
             return self._cached_image
 
-        # Build cache key from both data sources
+        # Build cache key from the render inputs, not the display timestamp —
+        # display_map re-broadcasts with a new timestamp even when the robot
+        # hasn't moved. hash() of a bytes object is cached by CPython, so
+        # hashing the unchanged compressed map is O(1) after the first frame.
         static_ts = static_map.created_at or 0
         display_ts = display.timestamp if display else 0
-        new_key = (static_ts, display_ts)
+        pose = (
+            (display.robot_x, display.robot_y, display.robot_heading)
+            if display
+            else None
+        )
+        new_key = (static_ts, hash(compressed), pose)
 
         now = time.monotonic()
         since_render = now - self._last_render_time if self._last_render_time else 999
 
         # Skip re-render if nothing changed
         if new_key == self._cache_key and self._cached_image:
+            self._rendered_data = data
+            return self._cached_image
+
+        # A render is already running — wait for it rather than queueing
+        # another executor job. Frames that arrive meanwhile are dropped;
+        # the next call renders whatever is newest by then.
+        if self._render_task and not self._render_task.done():
+            await asyncio.shield(self._render_task)
             return self._cached_image
 
         # Throttle renders during cleaning (display_map arrives every ~1.5s)
@@ -103,36 +145,75 @@ class NarwalMapImage(NarwalEntity, ImageEntity):
         ):
             return self._cached_image
 
+        # Room names and grid parameters from static map
+        if static_map is not self._static_source:
+            self._room_names = {
+                r.room_id: r.name for r in static_map.rooms if r.name
+            } if static_map.rooms else None
+            self._grid_params = (
+                static_map.resolution, static_map.origin_x, static_map.origin_y,
+            )
+            self._static_source = static_map
+        room_names = self._room_names
+
         # Robot position from display_map (convert dm → grid pixels)
         robot_x = None
         robot_y = None
         robot_heading = None
         if display:
-            grid_pos = display.to_grid_coords(
-                static_map.resolution, static_map.origin_x, static_map.origin_y,
-            )
+            grid_pos = display.to_grid_coords(*self._grid_params)
             if grid_pos is not None:
                 robot_x, robot_y = grid_pos
                 robot_heading = display.robot_heading
 
-        # Dock position and room names from static map
+        # Dock position from static map
         dock_x = static_map.dock_x
         dock_y = static_map.dock_y
-        room_names: dict[int, str] | None = None
-        if static_map.rooms:
-            room_names = {
-                r.room_id: r.name for r in static_map.rooms if r.name
-            }
 
-        # Render in executor (Pillow is CPU-bound)
+        # Shielded so a caller giving up doesn't abort the shared render
+        self._render_task = self.hass.async_create_task(
+            self._async_render(
+                new_key,
+                now,
+                compressed,
+                width,
+                height,
+                robot_x,
+                robot_y,
+                robot_heading,
+                dock_x,
+                dock_y,
+                room_names,
+            )
+        )
+        await asyncio.shield(self._render_task)
+        if self._cache_key == new_key:
+            self._rendered_data = data
+        return self._cached_image
+
+    async def _async_render(
+        self,
+        key: tuple[int, int, tuple[float, float, float] | None],
+        started: float,
+        compressed: bytes,
+        width: int,
+        height: int,
+        robot_x: float | None,
+        robot_y: float | None,
+        robot_heading: float | None,
+        dock_x: float | None,
+        dock_y: float | None,
+        room_names: dict[int, str] | None,
+    ) -> None:
+        """Render the map in the executor and cache the PNG (Pillow is CPU-bound)."""
         try:
             from .narwal_client.map_renderer import render_map_from_compressed
 
             png_bytes = await self.hass.async_add_executor_job(
                 render_map_from_compressed,
-                static_map.compressed_map,
-                static_map.width,
-                static_map.height,
+                compressed,
+                width,
+                height,
                 robot_x,
                 robot_y,
                 robot_heading,
@@ -143,10 +224,8 @@ class NarwalMapImage(NarwalEntity, ImageEntity):
 
             if png_bytes:
                 self._cached_image = png_bytes
-                self._cache_key = new_key
-                self._last_render_time = now
+                self._cache_key = key
+                self._last_render_time = started
 
         except Exception:
             _LOGGER.exception("Failed to render map image")
-
-        return self._cached_image
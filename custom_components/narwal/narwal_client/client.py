@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import functools
 import logging
 import random
 import time
 from collections.abc import Callable
+from types import ModuleType
 from typing import Any
 
 import websockets
@@ -44,6 +47,11 @@ from .const import (
     TOPIC_CMD_START_CLEAN,
     TOPIC_CMD_WASH_MOP,
     TOPIC_CMD_YELL,
+    TOPIC_DISPLAY_MAP,
+    TOPIC_DOWNLOAD_STATUS,
+    TOPIC_ROBOT_BASE_STATUS,
+    TOPIC_UPGRADE_STATUS,
+    TOPIC_WORKING_STATUS,
     DEFAULT_TOPIC_PREFIX,
     WAKE_TIMEOUT,
     FanLevel,
@@ -61,6 +69,38 @@ from .protocol import (
 _LOGGER = logging.getLogger(__name__)
 
 
+# blackboxprotobuf module, imported on first decode
+_bbp: ModuleType | None = None
+
+
+def _decode_message(payload: bytes) -> dict[str, Any]:
+    """Decode a protobuf payload without a schema using blackboxprotobuf."""
+    global _bbp
+    if _bbp is None:
+        import blackboxprotobuf  # lazy import — heavy dependency
+
+        _bbp = blackboxprotobuf
+    decoded, _ = _bbp.decode_message(payload)
+    return decoded
+
+
+@functools.lru_cache(maxsize=64)
+def _decode_broadcast_cached(payload: bytes) -> dict[str, Any]:
+    """Decode a broadcast payload, memoizing recent results (shared, read-only)."""
+    return _decode_message(payload)
+
+
+def _decode_broadcast(payload: bytes) -> dict[str, Any]:
+    """Decode a broadcast payload, reusing recent decodes.
+
+    The robot repeats byte-identical status broadcasts while idle, so most
+    frames skip blackboxprotobuf's pure-Python decode. Callers get their own
+    copy: NarwalState keeps the dict as raw_*_status, where a consumer's
+    mutation must not leak into later decodes of the same payload.
+    """
+    return copy.deepcopy(_decode_broadcast_cached(payload))
+
+
 class NarwalConnectionError(Exception):
     """Raised when connection to the vacuum fails."""
 
@@ -81,6 +121,34 @@ class NarwalClient:
         await client.disconnect()
     """
 
+    # Touched on every frame; slots skip the per-instance __dict__
+    __slots__ = (
+        "host",
+        "port",
+        "device_id",
+        "url",
+        "topic_prefix",
+        "state",
+        "on_state_update",
+        "on_message",
+        "_ws",
+        "_listen_task",
+        "_heartbeat_task",
+        "_keepalive_task",
+        "_connected",
+        "_should_reconnect",
+        "_listener_active",
+        "_robot_awake",
+        "_last_broadcast_time",
+        "_command_lock",
+        "_pending_response",
+        "_pending_topic",
+        "_wake_frames_key",
+        "_wake_frames",
+        "_heartbeat_frame_key",
+        "_heartbeat_frame",
+    )
+
     def __init__(
         self,
         host: str,
@@ -103,10 +171,19 @@ class NarwalClient:
         self._connected = asyncio.Event()
         self._should_reconnect = True
         self._listener_active = False  # True when start_listening() is running recv loop
-        self._robot_awake = False  # True once we receive a broadcast
+        self._robot_awake = asyncio.Event()  # set once we receive a broadcast
         self._last_broadcast_time: float = 0.0  # monotonic time of last broadcast
-        # Queue for field5 command responses
-        self._response_queue: asyncio.Queue[NarwalMessage] = asyncio.Queue()
+        # field5 responses carry no request id — one command in flight at a
+        # time, so a single future is enough to route the response
+        self._command_lock = asyncio.Lock()
+        self._pending_response: asyncio.Future[NarwalMessage] | None = None
+        self._pending_topic = ""
+        # Encoded wake burst, keyed by the (topic_prefix, device_id) it targets
+        self._wake_frames_key: tuple[str, str] | None = None
+        self._wake_frames: list[tuple[str, bytes]] = []
+        # Encoded keepalive heartbeat, keyed the same way
+        self._heartbeat_frame_key: tuple[str, str] | None = None
+        self._heartbeat_frame = b""
 
     def _full_topic(self, short_topic: str) -> str:
         """Build the full topic path."""
@@ -120,7 +197,7 @@ class NarwalClient:
     @property
     def robot_awake(self) -> bool:
         """Return True if the robot is actively broadcasting."""
-        return self._robot_awake
+        return self._robot_awake.is_set()
 
     async def connect(self) -> None:
         """Establish WebSocket connection to the vacuum.
@@ -129,8 +206,9 @@ class NarwalClient:
             NarwalConnectionError: If connection cannot be established.
         """
         try:
+            # Frames are small protobufs — permessage-deflate only costs CPU
             self._ws = await websockets.connect(
-                self.url, ping_interval=30, ping_timeout=10
+                self.url, ping_interval=30, ping_timeout=10, compression=None
             )
             self._connected.set()
             _LOGGER.info("Connected to Narwal vacuum at %s", self.url)
@@ -180,15 +258,16 @@ class NarwalClient:
         _LOGGER.debug("Sent discovery wake commands (device_id='%s')", self.device_id)
 
         wake_index = 0  # cycle through wake frames on retry
-        deadline = asyncio.get_event_loop().time() + timeout
-        while asyncio.get_event_loop().time() < deadline:
-            remaining = deadline - asyncio.get_event_loop().time()
-            if remaining <= 0:
-                break
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
             try:
                 data = await asyncio.wait_for(
                     self._ws.recv(), timeout=min(remaining, 2.0)
                 )
+            except websockets.exceptions.ConnectionClosed as err:
+                raise NarwalConnectionError(
+                    f"Connection closed during discovery: {err}"
+                ) from err
             except asyncio.TimeoutError:
                 # Re-send wake commands, cycling through prefixes
                 try:
@@ -225,14 +304,16 @@ class NarwalClient:
 
             # Fallback: broadcast messages (field4/0x22) have device_id in topic
             if msg.field_tag != PROTOBUF_FIELD5_TAG and msg.topic:
-                parts = msg.topic.split("/")
                 # Topic format: /{product_key}/{device_id}/{category}/{type}
-                if len(parts) >= 4 and parts[2]:
+                _, _, rest = msg.topic.partition("/")
+                product_key, _, rest = rest.partition("/")
+                device_id, sep, _ = rest.partition("/")
+                if sep and device_id:
                     # Extract product_key from topic to set correct prefix
-                    if parts[1]:
-                        self.topic_prefix = f"/{parts[1]}"
+                    if product_key:
+                        self.topic_prefix = f"/{product_key}"
                         _LOGGER.info("Topic prefix from broadcast: %s", self.topic_prefix)
-                    self.device_id = parts[2]
+                    self.device_id = device_id
                     _LOGGER.info("Discovered device_id from broadcast: %s", self.device_id)
                     return self.device_id
 
@@ -244,7 +325,7 @@ class NarwalClient:
         """Disconnect from the vacuum and stop all tasks."""
         self._should_reconnect = False
         self._listener_active = False
-        self._robot_awake = False
+        self._robot_awake.clear()
         self._connected.clear()
 
         for task in (self._heartbeat_task, self._keepalive_task, self._listen_task):
@@ -294,7 +375,7 @@ class NarwalClient:
                 _LOGGER.exception("Unexpected error in listener")
             finally:
                 self._listener_active = False
-                self._robot_awake = False
+                self._robot_awake.clear()
                 self._connected.clear()
                 for task in (self._heartbeat_task, self._keepalive_task):
                     if task and not task.done():
@@ -325,50 +406,96 @@ class NarwalClient:
 
         # Field5 (0x2a) messages are command responses
         if msg.field_tag == PROTOBUF_FIELD5_TAG:
-            await self._response_queue.put(msg)
+            pending = self._pending_response
+            if pending is not None and not pending.done() and self._answers_pending(msg):
+                pending.set_result(msg)
+            else:
+                _LOGGER.debug("Dropping unsolicited response on %s", msg.short_topic)
             return
 
+        self._process_broadcast(msg)
+
+    # Commands sent without awaiting a reply (wake burst, keepalive heartbeat)
+    _UNAWAITED_TOPICS = frozenset(
+        (
+            TOPIC_CMD_NOTIFY_APP_EVENT,
+            TOPIC_CMD_ACTIVE_ROBOT,
+            TOPIC_CMD_APP_HEARTBEAT,
+            TOPIC_CMD_GET_BASE_STATUS,
+            TOPIC_CMD_GET_DEVICE_INFO,
+            TOPIC_CMD_PING,
+        )
+    )
+
+    def _answers_pending(self, msg: NarwalMessage) -> bool:
+        """Return False for a response that belongs to an unawaited command.
+
+        Responses carry no request id, and the wake burst and keepalive send
+        commands that nobody waits for. A response naming one of those
+        topics only answers the pending command if it has the same topic;
+        a response on any other topic is still taken as the answer.
+        """
+        short_topic = msg.short_topic
+        return (
+            short_topic == self._pending_topic
+            or short_topic not in self._UNAWAITED_TOPICS
+        )
+
+    def _process_broadcast(self, msg: NarwalMessage) -> None:
+        """Update state from a broadcast and notify callbacks."""
         # Any broadcast means the robot is awake
         self._last_broadcast_time = time.monotonic()
-        if not self._robot_awake:
-            self._robot_awake = True
+        if not self._robot_awake.is_set():
+            self._robot_awake.set()
             _LOGGER.info("Robot is awake (received broadcast)")
 
         if self.on_message:
             self.on_message(msg)
 
-        # Decode protobuf and update state based on topic
+        # Decode protobuf and update state based on topic; topics that
+        # cannot change state are not worth decoding, but still count as a
+        # push for on_state_update
         short_topic = msg.short_topic
-        try:
-            decoded = self._decode_protobuf(msg.payload)
-        except Exception:
-            _LOGGER.debug("Failed to decode protobuf for topic %s", short_topic)
-            return
+        if short_topic in self._STATE_TOPICS:
+            try:
+                decoded = _decode_broadcast(msg.payload)
+            except Exception:
+                _LOGGER.debug("Failed to decode protobuf for topic %s", short_topic)
+                return
+
+            self._apply_broadcast(short_topic, decoded)
 
-        if short_topic == "status/working_status":
-            self.state.update_from_working_status(decoded)
-        elif short_topic == "status/robot_base_status":
+        if self.on_state_update:
+            self.on_state_update(self.state)
+
+    # Broadcasts that map straight onto a NarwalState updater
+    _STATE_UPDATERS: dict[str, Callable[[NarwalState, dict[str, Any]], None]] = {
+        TOPIC_WORKING_STATUS: NarwalState.update_from_working_status,
+        TOPIC_UPGRADE_STATUS: NarwalState.update_from_upgrade_status,
+        TOPIC_DOWNLOAD_STATUS: NarwalState.update_from_download_status,
+    }
+    # Every topic _apply_broadcast can act on
+    _STATE_TOPICS = frozenset(
+        (*_STATE_UPDATERS, TOPIC_DISPLAY_MAP, TOPIC_ROBOT_BASE_STATUS)
+    )
+
+    def _apply_broadcast(self, short_topic: str, decoded: dict[str, Any]) -> None:
+        """Update state from a decoded broadcast."""
+        updater = self._STATE_UPDATERS.get(short_topic)
+        if updater is not None:
+            updater(self.state, decoded)
+        elif short_topic == TOPIC_DISPLAY_MAP:
+            self.state.map_display_data = MapDisplayData.from_broadcast(decoded)
+        elif short_topic == TOPIC_ROBOT_BASE_STATUS:
             was_cleaning = self.state.is_cleaning
             self.state.update_from_base_status(decoded)
             # Clear stale display_map when robot stops cleaning
             if was_cleaning and not self.state.is_cleaning:
                 self.state.map_display_data = None
-        elif short_topic == "upgrade/upgrade_status":
-            self.state.update_from_upgrade_status(decoded)
-        elif short_topic == "status/download_status":
-            self.state.update_from_download_status(decoded)
-        elif short_topic == "map/display_map":
-            self.state.map_display_data = MapDisplayData.from_broadcast(decoded)
-
-        if self.on_state_update:
-            self.on_state_update(self.state)
 
     def _decode_protobuf(self, payload: bytes) -> dict[str, Any]:
         """Decode a protobuf payload without a schema using blackboxprotobuf."""
-        import blackboxprotobuf  # lazy import — heavy dependency
-
-        decoded, _ = blackboxprotobuf.decode_message(payload)
-        return decoded
+        return _decode_message(payload)
 
     async def _heartbeat_loop(self) -> None:
         """Send periodic WebSocket pings to keep the connection alive."""
@@ -388,6 +515,9 @@ class NarwalClient:
     @staticmethod
     def _encode_varint(value: int) -> bytes:
         """Encode an integer as a protobuf varint."""
+        # Tags and most field values fit in a single byte
+        if 0 <= value < 0x80:
+            return bytes((value,))
         result = []
         while value > 0x7F:
             result.append((value & 0x7F) | 0x80)
@@ -405,7 +535,7 @@ class NarwalClient:
     def _encode_bytes_field(cls, field_num: int, data: bytes) -> bytes:
         """Encode a protobuf length-delimited field."""
         tag = (field_num << 3) | 2  # wire type 2 = length-delimited
-        return cls._encode_varint(tag) + cls._encode_varint(len(data)) + data
+        return b"".join((cls._encode_varint(tag), cls._encode_varint(len(data)), data))
 
     @classmethod
     def _encode_string_field(cls, field_num: int, text: str) -> bytes:
@@ -414,11 +544,11 @@ class NarwalClient:
 
     # All broadcast topics the robot can send — used for active_robot_publish
     _ALL_BROADCAST_TOPICS = [
-        "status/robot_base_status",
-        "status/working_status",
-        "upgrade/upgrade_status",
-        "status/download_status",
-        "map/display_map",
+        TOPIC_ROBOT_BASE_STATUS,
+        TOPIC_WORKING_STATUS,
+        TOPIC_UPGRADE_STATUS,
+        TOPIC_DOWNLOAD_STATUS,
+        TOPIC_DISPLAY_MAP,
         "status/time_line_status",
     ]
 
@@ -429,14 +559,13 @@ class NarwalClient:
         broadcast and for how long. Format: repeated field 1 = TopicDuration
         sub-messages with {1: topic_string, 2: duration_seconds}.
         """
-        payload = b""
-        for topic in self._ALL_BROADCAST_TOPICS:
-            inner = (
-                self._encode_string_field(1, topic)
-                + self._encode_varint_field(2, duration)
+        duration_field = self._encode_varint_field(2, duration)
+        return b"".join(
+            self._encode_bytes_field(
+                1, self._encode_string_field(1, topic) + duration_field
             )
-            payload += self._encode_bytes_field(1, inner)
-        return payload
+            for topic in self._ALL_BROADCAST_TOPICS
+        )
 
     def _build_wake_commands(self) -> list[tuple[str, bytes]]:
         """Build the sequence of wake commands to try.
@@ -471,26 +600,57 @@ class NarwalClient:
 
         return cmds
 
+    def _get_wake_frames(self) -> list[tuple[str, bytes]]:
+        """Return the wake burst as (short_topic, frame) pairs.
+
+        The frames depend only on the topic prefix and device ID, so they are
+        encoded once and rebuilt only when either changes.
+        """
+        key = (self.topic_prefix, self.device_id)
+        if key != self._wake_frames_key:
+            self._wake_frames = [
+                (short_topic, build_frame(self._full_topic(short_topic), payload))
+                for short_topic, payload in self._build_wake_commands()
+            ]
+            self._wake_frames_key = key
+        return self._wake_frames
+
+    def _get_heartbeat_frame(self) -> bytes:
+        """Return the encoded app heartbeat, rebuilt only when the topic changes."""
+        key = (self.topic_prefix, self.device_id)
+        if key != self._heartbeat_frame_key:
+            self._heartbeat_frame = build_frame(
+                self._full_topic(TOPIC_CMD_APP_HEARTBEAT),
+                self._encode_varint_field(1, 1),
+            )
+            self._heartbeat_frame_key = key
+        return self._heartbeat_frame
+
+    async def _send_frames(self, frames: list[bytes]) -> None:
+        """Send frames one after another, in order."""
+        try:
+            for frame in frames:
+                await self._ws.send(frame)
+        except (websockets.exceptions.ConnectionClosed, OSError) as err:
+            raise NarwalConnectionError(f"Failed to send commands: {err}") from err
+
     async def _send_wake_burst(self) -> None:
         """Send all wake candidate commands in quick succession.
 
-        Fire-and-forget: sends each command with a short delay between them.
-        Does not wait for responses (the listener loop handles those).
+        Fire-and-forget: sends each command back to back, one WebSocket
+        message per frame. Does not wait for responses (the listener loop
+        handles those).
         """
         if not self.connected or not self._ws:
             return
 
-        commands = self._build_wake_commands()
-        for short_topic, payload in commands:
-            try:
-                full_topic = self._full_topic(short_topic)
-                frame = build_frame(full_topic, payload)
-                await self._ws.send(frame)
-                _LOGGER.debug("Wake burst: sent %s (%d bytes)", short_topic, len(payload))
-            except Exception:
-                _LOGGER.debug("Wake burst: failed to send %s", short_topic)
-                return  # connection probably lost
-            await asyncio.sleep(0.2)
+        wake_frames = self._get_wake_frames()
+        try:
+            await self._send_frames([frame for _, frame in wake_frames])
+        except Exception:
+            _LOGGER.debug("Wake burst: failed to send", exc_info=True)
+            return  # connection probably lost
+        _LOGGER.debug("Wake burst: sent %d commands", len(wake_frames))
 
     async def wake(self, timeout: float = WAKE_TIMEOUT) -> bool:
         """Attempt to wake the robot from sleep.
@@ -504,7 +664,7 @@ class NarwalClient:
         Returns:
             True if the robot is awake (received broadcasts), False otherwise.
         """
-        if self._robot_awake:
+        if self._robot_awake.is_set():
             return True
 
         if not self.connected:
@@ -512,25 +672,24 @@ class NarwalClient:
 
         _LOGGER.info("Attempting to wake robot...")
 
-        deadline = asyncio.get_event_loop().time() + timeout
+        deadline = time.monotonic() + timeout
         attempt = 0
 
-        while asyncio.get_event_loop().time() < deadline:
+        while (remaining := deadline - time.monotonic()) > 0:
             attempt += 1
             _LOGGER.debug("Wake attempt %d", attempt)
 
             await self._send_wake_burst()
 
             # Wait up to 5 seconds for a broadcast to arrive
-            wait_end = min(
-                asyncio.get_event_loop().time() + 5.0,
-                deadline,
-            )
-            while asyncio.get_event_loop().time() < wait_end:
-                if self._robot_awake:
-                    _LOGGER.info("Robot woke up after %d attempt(s)", attempt)
-                    return True
-                await asyncio.sleep(0.3)
+            try:
+                await asyncio.wait_for(
+                    self._robot_awake.wait(), timeout=min(remaining, 5.0)
+                )
+            except asyncio.TimeoutError:
+                continue
+            _LOGGER.info("Robot woke up after %d attempt(s)", attempt)
+            return True
 
         _LOGGER.warning("Robot did not wake up within %.0fs (%d attempts)", timeout, attempt)
         return False
@@ -550,26 +709,19 @@ class NarwalClient:
                     break
 
                 # Check if broadcasts have gone stale (robot fell back asleep)
-                if (
-                    self._robot_awake
-                    and self._last_broadcast_time > 0
-                    and time.monotonic() - self._last_broadcast_time
-                    > BROADCAST_STALE_TIMEOUT
-                ):
-                    _LOGGER.info(
-                        "No broadcast for %.0fs — robot may have gone to sleep",
-                        time.monotonic() - self._last_broadcast_time,
-                    )
-                    self._robot_awake = False
-
-                if self._robot_awake:
+                if self._robot_awake.is_set() and self._last_broadcast_time > 0:
+                    silence = time.monotonic() - self._last_broadcast_time
+                    if silence > BROADCAST_STALE_TIMEOUT:
+                        _LOGGER.info(
+                            "No broadcast for %.0fs — robot may have gone to sleep",
+                            silence,
+                        )
+                        self._robot_awake.clear()
+
+                if self._robot_awake.is_set():
                     # Robot is awake — send lightweight heartbeat
                     try:
-                        payload = self._encode_varint_field(1, 1)
-                        frame = build_frame(
-                            self._full_topic(TOPIC_CMD_APP_HEARTBEAT), payload
-                        )
-                        await self._ws.send(frame)
+                        await self._ws.send(self._get_heartbeat_frame())
                         _LOGGER.debug("Keepalive heartbeat sent")
                     except Exception:
                         _LOGGER.debug("Keepalive send failed")
@@ -595,9 +747,12 @@ class NarwalClient:
         """Send a command and wait for the field5 response.
 
         Works both with and without start_listening() running. When the
-        listener loop is active, responses arrive via the queue. Otherwise,
+        listener loop is active, responses arrive via a future. Otherwise,
         this method directly reads from the WebSocket.
 
+        Responses cannot be correlated to requests, so concurrent callers are
+        serialized (FIFO) and may safely be gathered.
+
         Args:
             short_topic: Command topic without prefix/device_id.
             payload: Protobuf-encoded payload (empty for most commands).
@@ -607,37 +762,49 @@ class NarwalClient:
             CommandResponse with result code and decoded data.
 
         Raises:
-            NarwalConnectionError: If not connected.
+            NarwalConnectionError: If not connected or the connection drops.
             NarwalCommandError: If response times out.
         """
         if not self.connected:
             raise NarwalConnectionError("Not connected to vacuum")
 
-        # Drain any stale responses
-        while not self._response_queue.empty():
-            try:
-                self._response_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
-
-        full_topic = self._full_topic(short_topic)
-        frame = build_frame(full_topic, payload)
-        await self._ws.send(frame)
-        _LOGGER.debug("Sent command: %s (%d bytes)", short_topic, len(frame))
-
-        # If listener is running, wait on the queue (avoid concurrent recv)
-        if self._listener_active:
+        async with self._command_lock:
+            # Build inside the lock — an earlier get_device_info may have
+            # just updated the topic prefix
+            full_topic = self._full_topic(short_topic)
+            frame = build_frame(full_topic, payload)
+            # If listener is running, it resolves this future (avoid
+            # concurrent recv); responses arriving with no command pending
+            # are dropped
+            if self._listener_active:
+                self._pending_response = asyncio.get_running_loop().create_future()
+                self._pending_topic = short_topic
             try:
-                msg = await asyncio.wait_for(
-                    self._response_queue.get(), timeout=timeout
-                )
-            except asyncio.TimeoutError:
-                raise NarwalCommandError(
-                    f"No response for command '{short_topic}' within {timeout}s"
-                ) from None
-        else:
-            # No listener — read directly from websocket
-            msg = await self._wait_for_field5_response(timeout)
+                await self._ws.send(frame)
+            except (websockets.exceptions.ConnectionClosed, OSError) as err:
+                self._pending_response = None
+                raise NarwalConnectionError(
+                    f"Failed to send command '{short_topic}': {err}"
+                ) from err
+            _LOGGER.debug("Sent command: %s (%d bytes)", short_topic, len(frame))
+
+            if self._pending_response is not None:
+                try:
+                    msg = await asyncio.wait_for(self._pending_response, timeout=timeout)
+                except asyncio.TimeoutError:
+                    raise NarwalCommandError(
+                        f"No response for command '{short_topic}' within {timeout}s"
+                    ) from None
+                finally:
+                    self._pending_response = None
+            else:
+                # No listener — read directly from websocket
+                try:
+                    msg = await self._wait_for_field5_response(timeout)
+                except websockets.exceptions.ConnectionClosed as err:
+                    raise NarwalConnectionError(
+                        f"Connection closed awaiting '{short_topic}': {err}"
+                    ) from err
 
         # Decode response
         try:
@@ -663,13 +830,8 @@ class NarwalClient:
         self, timeout: float
     ) -> NarwalMessage:
         """Read from WebSocket until a field5 response arrives."""
-        import time
-
         deadline = time.monotonic() + timeout
-        while time.monotonic() < deadline:
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
-                break
+        while (remaining := deadline - time.monotonic()) > 0:
             try:
                 data = await asyncio.wait_for(
                     self._ws.recv(), timeout=min(remaining, 1.0)
@@ -689,22 +851,7 @@ class NarwalClient:
                 return msg
 
             # Process broadcast messages while waiting
-            short_topic = msg.short_topic
-            try:
-                decoded = self._decode_protobuf(msg.payload)
-            except Exception:
-                continue
-
-            if short_topic == "status/working_status":
-                self.state.update_from_working_status(decoded)
-            elif short_topic == "status/robot_base_status":
-                self.state.update_from_base_status(decoded)
-            elif short_topic == "upgrade/upgrade_status":
-                self.state.update_from_upgrade_status(decoded)
-            elif short_topic == "status/download_status":
-                self.state.update_from_download_status(decoded)
-            elif short_topic == "map/display_map":
-                self.state.map_display_data = MapDisplayData.from_broadcast(decoded)
+            self._process_broadcast(msg)
 
         raise NarwalCommandError(
             f"No field5 response within {timeout}s"
@@ -840,12 +987,11 @@ class NarwalClient:
         resp = await self.send_command(TOPIC_CMD_GET_BASE_STATUS)
         status_data = resp.data.get("2", {})
         if status_data:
-            _LOGGER.debug(
-                "get_status response (full=%s): field3=%r, field2=%r",
-                full_update,
-                status_data.get("3") if isinstance(status_data, dict) else None,
-                status_data.get("2") if isinstance(status_data, dict) else None,
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG) and isinstance(status_data, dict):
+                _LOGGER.debug(
+                    "get_status response (full=%s): field3=%r, field2=%r",
+                    full_update, status_data.get("3"), status_data.get("2"),
+                )
             if full_update:
                 self.state.update_from_base_status(status_data)
             else:
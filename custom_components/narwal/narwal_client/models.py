@@ -8,6 +8,10 @@ from typing import Any
 
 from .const import CommandResult, FanLevel, MopHumidity, WorkingStatus
 
+# Status groups checked by the NarwalState properties on every broadcast
+_CLEANING_STATES = frozenset({WorkingStatus.CLEANING, WorkingStatus.CLEANING_ALT})
+_DOCKED_STATES = frozenset({WorkingStatus.DOCKED, WorkingStatus.CHARGED})
+
 
 @dataclass
 class DeviceInfo:
@@ -60,7 +64,8 @@ class MapData:
     dock_y: float | None = None
     origin_x: int = 0  # x pixel offset from field 2.6.3
     origin_y: int = 0  # y pixel offset from field 2.6.1
-    raw: dict[str, Any] = field(default_factory=dict)
+    # Raw payload is kept for debugging only — excluded from equality
+    raw: dict[str, Any] = field(default_factory=dict, compare=False)
 
     @classmethod
     def from_response(cls, decoded: dict[str, Any]) -> MapData:
@@ -171,7 +176,9 @@ class MapDisplayData:
     robot_x: float = 0.0  # decimeters, world coordinates
     robot_y: float = 0.0  # decimeters, world coordinates
     robot_heading: float = 0.0  # degrees (converted from radians for renderer)
-    timestamp: int = 0  # milliseconds since epoch (field 10)
+    # milliseconds since epoch (field 10) — bumped on every broadcast, so it is
+    # excluded from equality: a stationary robot compares equal between frames
+    timestamp: int = field(default=0, compare=False)
 
     def to_grid_coords(
         self, resolution: int, origin_x: int, origin_y: int,
@@ -264,7 +271,9 @@ class CommandResponse:
 class NarwalState:
     """Complete state of a Narwal vacuum.
 
-    Updated incrementally as different topic messages arrive.
+    Updated incrementally as different topic messages arrive. Equality
+    compares decoded values only (timestamps and raw payloads are ignored),
+    so consumers can detect "nothing changed" between snapshots.
     """
 
     # Core status
@@ -277,9 +286,9 @@ class NarwalState:
     # Device identity
     device_info: DeviceInfo | None = None
 
-    # Session
+    # Session (timestamp ticks on every broadcast — not part of equality)
     session_id: str = ""
-    timestamp: int = 0
+    timestamp: int = field(default=0, compare=False)
 
     # Position (from map data)
     position: Position | None = None
@@ -327,15 +336,17 @@ class NarwalState:
     # Secondary confirmation signal.
     dock_field47: int = 0
 
-    # Raw data for fields we haven't fully decoded yet
-    raw_base_status: dict[str, Any] = field(default_factory=dict)
-    raw_working_status: dict[str, Any] = field(default_factory=dict)
+    # Raw data for fields we haven't fully decoded yet. Excluded from equality
+    # so that two snapshots with the same decoded values compare equal even
+    # though the raw payloads carry per-broadcast counters.
+    raw_base_status: dict[str, Any] = field(default_factory=dict, compare=False)
+    raw_working_status: dict[str, Any] = field(default_factory=dict, compare=False)
 
     @property
     def is_cleaning(self) -> bool:
         """True when actively cleaning (not paused, not returning to dock)."""
         return (
-            self.working_status in (WorkingStatus.CLEANING, WorkingStatus.CLEANING_ALT)
+            self.working_status in _CLEANING_STATES
             and not self.is_paused
             and not self.is_returning_to_dock
         )
@@ -354,7 +365,7 @@ class NarwalState:
         Fields 11 and 47 validated via dock_research.py guided test with
         5 captures across on-dock and off-dock states — perfect correlation.
         """
-        if self.working_status in (WorkingStatus.DOCKED, WorkingStatus.CHARGED):
+        if self.working_status in _DOCKED_STATES:
             return True
         if self.working_status == WorkingStatus.STANDBY:
             if self.dock_sub_state == 1:
@@ -379,9 +390,7 @@ class NarwalState:
         transitions to STANDBY/DOCKED/CHARGED, it has already docked
         even if field 3.7 is momentarily still set.
         """
-        if self.working_status not in (
-            WorkingStatus.CLEANING, WorkingStatus.CLEANING_ALT,
-        ):
+        if self.working_status not in _CLEANING_STATES:
             return False
         if self.is_returning_to_dock:
             return True
@@ -54,12 +54,12 @@ class NarwalVacuum(NarwalEntity, StateVacuumEntity):
         | VacuumEntityFeature.FAN_SPEED
         | VacuumEntityFeature.LOCATE
     )
-    _attr_fan_speed_list = FAN_SPEED_LIST
+    _attr_fan_speed_list = list(FAN_SPEED_LIST)
 
     def __init__(self, coordinator: NarwalCoordinator) -> None:
         """Initialize the vacuum entity."""
         super().__init__(coordinator)
-        self._attr_unique_id = coordinator.config_entry.data["device_id"]
+        self._attr_unique_id = coordinator.device_id
         self._last_fan_speed: str | None = None
 
     @property
@@ -95,18 +95,22 @@ class NarwalVacuum(NarwalEntity, StateVacuumEntity):
     async def async_start(self) -> None:
         """Start cleaning."""
         await self.coordinator.client.start()
+        self.coordinator.async_trigger_fast_poll()
 
     async def async_stop(self, **kwargs) -> None:
         """Stop cleaning."""
         await self.coordinator.client.stop()
+        self.coordinator.async_trigger_fast_poll()
 
     async def async_pause(self) -> None:
         """Pause cleaning."""
         await self.coordinator.client.pause()
+        self.coordinator.async_trigger_fast_poll()
 
     async def async_return_to_base(self, **kwargs) -> None:
         """Return to the dock."""
         await self.coordinator.client.return_to_base()
+        self.coordinator.async_trigger_fast_poll()
 
     async def async_locate(self, **kwargs) -> None:
         """Locate the vacuum — robot says 'Robot is here'."""
@@ -23,7 +23,7 @@ class ProtocolError(Exception):
     """Raised when a frame cannot be parsed."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NarwalMessage:
     """A parsed Narwal WebSocket message."""
 
@@ -39,10 +39,10 @@ class NarwalMessage:
 
         '/{product_key}/{device_id}/status/working_status' → 'status/working_status'
         """
-        parts = self.topic.split("/")
-        # Skip empty string, prefix, device_id → rejoin the rest
-        if len(parts) >= 4:
-            return "/".join(parts[3:])
+        # Skip empty string, prefix, device_id → keep the unsplit rest
+        parts = self.topic.split("/", 3)
+        if len(parts) == 4:
+            return parts[3]
         return self.topic
 
 
@@ -64,8 +64,11 @@ def parse_frame(data: bytes) -> NarwalMessage:
     if data[0] != FRAME_TYPE_BYTE:
         raise ProtocolError(f"Invalid frame type byte: 0x{data[0]:02x} (expected 0x01)")
 
-    if data[2] not in (PROTOBUF_FIELD_TAG, PROTOBUF_FIELD5_TAG):
-        raise ProtocolError(f"Invalid protobuf field tag: 0x{data[2]:02x} (expected 0x22 or 0x2a)")
+    field_tag = data[2]
+    if field_tag not in (PROTOBUF_FIELD_TAG, PROTOBUF_FIELD5_TAG):
+        raise ProtocolError(
+            f"Invalid protobuf field tag: 0x{field_tag:02x} (expected 0x22 or 0x2a)"
+        )
 
     header_byte = data[1]
     topic_len = data[TOPIC_LENGTH_OFFSET]
@@ -87,7 +90,7 @@ def parse_frame(data: bytes) -> NarwalMessage:
         topic=topic,
         payload=payload,
         header_byte=header_byte,
-        field_tag=data[2],
+        field_tag=field_tag,
         raw=bytes(data),
     )
 
@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
+import websockets.exceptions
 
-from narwal_client.client import NarwalClient, NarwalConnectionError
+from narwal_client.client import (
+    NarwalClient,
+    NarwalCommandError,
+    NarwalConnectionError,
+    _decode_broadcast,
+    _decode_broadcast_cached,
+)
+from narwal_client.protocol import PROTOBUF_FIELD5_TAG, build_frame, parse_frame
 
 
 class TestNarwalClientInit:
@@ -39,3 +49,230 @@ class TestNarwalClientInit:
             asyncio.get_event_loop().run_until_complete(
                 client.send_raw("test/topic", b"\x08\x01")
             )
+
+
+def _response_frame(topic: str, payload: bytes) -> bytes:
+    """Build a field5 (0x2a) command response frame."""
+    frame = bytearray(build_frame(topic, payload))
+    frame[2] = PROTOBUF_FIELD5_TAG
+    return bytes(frame)
+
+
+class _FakeWebSocket:
+    """Records sent frames instead of writing to a socket."""
+
+    def __init__(self) -> None:
+        self.sent: list[bytes] = []
+
+    async def send(self, frame: bytes) -> None:
+        self.sent.append(frame)
+
+
+class TestEncodeVarint:
+    """Tests for the protobuf varint encoder used by wake commands."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (0, b"\x00"),
+            (1, b"\x01"),
+            (0x7F, b"\x7f"),
+            (0x80, b"\x80\x01"),
+            (600, b"\xd8\x04"),
+        ],
+    )
+    def test_encode(self, value: int, expected: bytes) -> None:
+        assert NarwalClient._encode_varint(value) == expected
+
+
+class TestWakeFrames:
+    """Tests for the cached wake burst."""
+
+    def test_frames_are_reused_until_prefix_changes(self) -> None:
+        client = NarwalClient("10.0.0.1", device_id="dev")
+        frames = client._get_wake_frames()
+        assert client._get_wake_frames() is frames
+
+        client.topic_prefix = "/NEWKEY"
+        rebuilt = client._get_wake_frames()
+        assert rebuilt is not frames
+        assert all(
+            parse_frame(frame).topic.startswith("/NEWKEY/dev/")
+            for _, frame in rebuilt
+        )
+
+    def test_heartbeat_follows_device_id(self) -> None:
+        client = NarwalClient("10.0.0.1", device_id="dev")
+        frame = client._get_heartbeat_frame()
+        assert client._get_heartbeat_frame() is frame
+
+        client.device_id = "other"
+        assert parse_frame(client._get_heartbeat_frame()).topic.split("/")[2] == "other"
+
+
+class TestDecodeBroadcast:
+    """Tests for the memoized broadcast decoder."""
+
+    def test_decodes_payload(self) -> None:
+        assert _decode_broadcast(b"\x08\x01") == {"1": 1}
+
+    def test_repeated_payload_is_served_from_cache(self) -> None:
+        payload = b"\x08\x07\x10\x03"
+        first = _decode_broadcast(payload)
+        hits = _decode_broadcast_cached.cache_info().hits
+        assert _decode_broadcast(payload) == first
+        assert _decode_broadcast_cached.cache_info().hits == hits + 1
+
+    def test_mutating_a_result_does_not_affect_the_cache(self) -> None:
+        payload = b"\x08\x09\x1a\x02\x08\x01"
+        first = _decode_broadcast(payload)
+        first["1"] = 0
+        first["3"]["1"] = 0
+        assert _decode_broadcast(payload) == {"1": 9, "3": {"1": 1}}
+
+
+class TestWake:
+    """Tests for waking the robot."""
+
+    async def test_returns_as_soon_as_a_broadcast_arrives(self) -> None:
+        client = NarwalClient("10.0.0.1", device_id="dev")
+        client._ws = _FakeWebSocket()
+        client._connected.set()
+
+        wake = asyncio.create_task(client.wake(timeout=10.0))
+        await asyncio.sleep(0)
+        await client._handle_message(
+            build_frame("/p/dev/status/working_status", b"\x08\x01")
+        )
+        assert await asyncio.wait_for(wake, timeout=1.0)
+        assert client.robot_awake
+
+    async def test_times_out_without_broadcast(self) -> None:
+        client = NarwalClient("10.0.0.1", device_id="dev")
+        client._ws = _FakeWebSocket()
+        client._connected.set()
+
+        assert not await client.wake(timeout=0.05)
+
+    async def test_send_errors_do_not_escape(self) -> None:
+        class _BrokenWebSocket:
+            async def send(self, frame: bytes) -> None:
+                raise RuntimeError("transport gone")
+
+        client = NarwalClient("10.0.0.1", device_id="dev")
+        client._ws = _BrokenWebSocket()
+        client._connected.set()
+
+        assert not await client.wake(timeout=0.05)
+
+
+class TestHandleMessage:
+    """Tests for broadcast handling."""
+
+    async def test_unhandled_topic_still_notifies(self) -> None:
+        client = NarwalClient("10.0.0.1", device_id="dev")
+        messages: list[object] = []
+        updates: list[object] = []
+        client.on_message = messages.append
+        client.on_state_update = updates.append
+        decodes = _decode_broadcast_cached.cache_info()
+
+        await client._handle_message(
+            build_frame("/p/dev/status/time_line_status", b"\x08\x0f")
+        )
+        # Not decoded, but still reported as a push
+        assert _decode_broadcast_cached.cache_info() == decodes
+        assert client.robot_awake
+        assert len(messages) == 1
+        assert updates == [client.state]
+
+
+class TestSendCommand:
+    """Tests for command/response handling with the listener running."""
+
+    async def test_concurrent_commands_are_serialized(self) -> None:
+        client = NarwalClient("10.0.0.1", device_id="dev")
+        ws = _FakeWebSocket()
+        client._ws = ws
+        client._connected.set()
+        client._listener_active = True
+
+        first = asyncio.create_task(client.send_command("test/first"))
+        second = asyncio.create_task(client.send_command("test/second"))
+        await asyncio.sleep(0)
+        # Second command must not be sent before the first one is answered
+        assert len(ws.sent) == 1
+        assert parse_frame(ws.sent[0]).short_topic == "test/first"
+
+        await client._handle_message(_response_frame("/p/dev/test/first", b"\x08\x01"))
+        assert (await first).result_code == 1
+        await asyncio.sleep(0)
+        assert len(ws.sent) == 2
+        assert parse_frame(ws.sent[1]).short_topic == "test/second"
+
+        await client._handle_message(_response_frame("/p/dev/test/second", b"\x08\x02"))
+        assert (await second).result_code == 2
+
+    async def test_unsolicited_response_is_dropped(self) -> None:
+        client = NarwalClient("10.0.0.1", device_id="dev")
+        client._ws = _FakeWebSocket()
+        client._connected.set()
+        client._listener_active = True
+
+        # A late response with no command pending must not answer the next one
+        await client._handle_message(_response_frame("/p/dev/test/stale", b"\x08\x01"))
+        with pytest.raises(NarwalCommandError):
+            await client.send_command("test/first", timeout=0.01)
+
+    async def test_wake_burst_response_does_not_answer_command(self) -> None:
+        client = NarwalClient("10.0.0.1", device_id="dev")
+        client._ws = _FakeWebSocket()
+        client._connected.set()
+        client._listener_active = True
+
+        command = asyncio.create_task(client.send_command("map/get_map"))
+        await asyncio.sleep(0)
+        await client._handle_message(
+            _response_frame("/p/dev/common/notify_app_event", b"\x08\x01")
+        )
+        assert not command.done()
+
+        await client._handle_message(_response_frame("/p/dev/map/get_map", b"\x08\x02"))
+        assert (await command).result_code == 2
+
+    async def test_broadcasts_are_processed_without_listener(self) -> None:
+        class _ScriptedWebSocket(_FakeWebSocket):
+            def __init__(self, frames: list[bytes]) -> None:
+                super().__init__()
+                self._frames = frames
+
+            async def recv(self) -> bytes:
+                return self._frames.pop(0)
+
+        client = NarwalClient("10.0.0.1", device_id="dev")
+        client._ws = _ScriptedWebSocket([
+            build_frame("/p/dev/status/working_status", b"\x08\x01"),
+            _response_frame("/p/dev/test/first", b"\x08\x01"),
+        ])
+        client._connected.set()
+        updates: list[object] = []
+        client.on_state_update = updates.append
+
+        assert (await client.send_command("test/first")).result_code == 1
+        assert client.robot_awake
+        assert updates == [client.state]
+
+    async def test_send_on_closed_socket_raises_connection_error(self) -> None:
+        class _ClosedWebSocket:
+            async def send(self, frame: bytes) -> None:
+                raise websockets.exceptions.ConnectionClosedError(None, None)
+
+        client = NarwalClient("10.0.0.1", device_id="dev")
+        client._ws = _ClosedWebSocket()
+        client._connected.set()
+        client._listener_active = True
+
+        with pytest.raises(NarwalConnectionError):
+            await client.send_command("test/first")
+        # The command lock must be released for the next caller
+        assert not client._command_lock.locked()
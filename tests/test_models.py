@@ -271,6 +271,21 @@ class TestNarwalState:
         state.update_from_base_status({"3": {"1": 255}})
         assert state.working_status == WorkingStatus.UNKNOWN
 
+    def test_equality_ignores_timestamp_and_raw(self) -> None:
+        """Snapshots differing only in per-broadcast counters compare equal."""
+        a = NarwalState()
+        a.update_from_base_status({"3": {"1": 10, "10": 1}, "36": 1000})
+        b = NarwalState()
+        b.update_from_base_status({"3": {"1": 10, "10": 1}, "36": 2000, "99": 7})
+        assert a == b
+
+    def test_equality_detects_status_change(self) -> None:
+        a = NarwalState()
+        a.update_from_base_status({"3": {"1": 10}})
+        b = NarwalState()
+        b.update_from_base_status({"3": {"1": 4}})
+        assert a != b
+
 
 def _float_to_uint32(f: float) -> int:
     """Encode a float as the uint32 bit pattern (for protobuf simulation)."""